@@ -0,0 +1,13 @@
+"""Apply pending schema migrations to the configured database (DATABASE_URL or DATABASE_PATH).
+
+Run once per deploy before starting several API workers with MIGRATE_ON_STARTUP=0.
+"""
+from main import MIGRATIONS, run_migrations
+
+applied = run_migrations()
+if applied:
+    names = {version: name for version, name, _ in MIGRATIONS}
+    for version in applied:
+        print(f"Applied migration {version}: {names[version]}")
+else:
+    print("Database schema is up to date")
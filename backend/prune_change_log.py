@@ -0,0 +1,12 @@
+"""Delete change_log entries older than CHANGE_LOG_RETENTION_DAYS (default 30) from the
+configured database (DATABASE_URL or DATABASE_PATH).
+
+Run it periodically, e.g. daily from cron. Clients that last synced before the oldest
+entry left get `reset` and `expired` from /api/changes and reload.
+"""
+from main import CHANGE_LOG_RETENTION_DAYS, engine, prune_change_log, run_migrations
+
+run_migrations()
+with engine.begin() as conn:
+    deleted = prune_change_log(conn)
+print(f"change_log: deleted {deleted} entries older than {CHANGE_LOG_RETENTION_DAYS:g} days")
@@ -0,0 +1,14 @@
+"""Recompute the subject area and domain concept closure tables from parent_id.
+
+The API keeps them current itself; run this after writing to subject_areas or
+domain_concepts around it (seed scripts, manual SQL) against the configured
+database (DATABASE_URL or DATABASE_PATH).
+"""
+from main import HIERARCHY_CLOSURES, engine, rebuild_hierarchy_closure, run_migrations, select, func
+
+run_migrations()
+with engine.begin() as conn:
+    rebuild_hierarchy_closure(conn)
+    for model, closure in HIERARCHY_CLOSURES.items():
+        count = conn.execute(select(func.count()).select_from(closure.__table__)).scalar()
+        print(f"{closure.__tablename__}: {count} rows for {model.__tablename__}")
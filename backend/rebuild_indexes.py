@@ -0,0 +1,28 @@
+"""Regenerate the derived search and filter tables from the data they index:
+
+  - reference_values from reference_data.data_json
+  - the reference data search index from reference_values
+  - the global search index from subject areas, domain concepts, references and fields
+
+The API keeps them current itself; run this after writing to those tables around it
+(seed scripts, manual SQL) against the configured database (DATABASE_URL or
+DATABASE_PATH). Until then field filters, sorts, /data/search and /api/search don't
+see those rows.
+"""
+from main import (
+    GLOBAL_SEARCH_TABLE, IS_POSTGRESQL, SEARCH_FTS_TABLE, ReferenceValueModel, engine, rebuild_global_search,
+    rebuild_reference_values, rebuild_search_index, run_migrations, select, func, text,
+)
+
+run_migrations()
+with engine.begin() as conn:
+    rebuild_reference_values(conn)
+    count = conn.execute(select(func.count()).select_from(ReferenceValueModel.__table__)).scalar()
+    print(f"{ReferenceValueModel.__tablename__}: {count} rows")
+    # On PostgreSQL both search indexes are GIN indexes, kept by the database
+    rebuild_search_index(conn)
+    rebuild_global_search(conn)
+    if not IS_POSTGRESQL:
+        for table in (SEARCH_FTS_TABLE, GLOBAL_SEARCH_TABLE):
+            count = conn.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+            print(f"{table}: {count} rows")
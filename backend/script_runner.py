@@ -0,0 +1,188 @@
+"""Runs one data_by_script reference script for the executor in main.py.
+
+    python -I script_runner.py '<settings json>' < script
+
+Prints {"rows": [...]} on success, {"error": "..."} when the script fails and
+{"unavailable": "..."} when the process can't set up its sandbox, as JSON on stdout.
+
+The process jails itself before it reads the script. With the sandbox on it moves into
+a network namespace of its own (no network), chroots into an empty directory (no
+files) and switches to an unprivileged user with no_new_privs, then caps its CPU time,
+address space and file writes and gives up fork and exec. That is what holds even if a
+script reaches os through some object's globals. The reduced builtins and the module
+allowlist only keep well-meaning scripts on the supported path. Without root it can't
+jail itself and refuses to run unless the sandbox is turned off.
+
+Only the standard library is imported here, so the process never loads the application.
+"""
+import ast
+import builtins
+import ctypes
+import importlib
+import json
+import os
+import pwd
+import resource
+import signal
+import sys
+import traceback
+from datetime import date, datetime
+
+SCRIPT_FILENAME = "<script>"
+BLOCKED_BUILTINS = {
+    "open", "exec", "eval", "compile", "input", "breakpoint", "help", "exit", "quit",
+    "copyright", "credits", "license",
+}
+# Imported lazily by allowed modules; the standard library is out of reach after the chroot
+PRELOADED_MODULES = ("_strptime",)
+CLONE_NEWNET = 0x40000000
+PR_SET_DUMPABLE = 4
+PR_SET_NO_NEW_PRIVS = 38
+
+
+class ScriptError(Exception):
+    """The script failed, returned something other than a list of rows, or hit a limit."""
+
+
+class SandboxError(Exception):
+    """The process could not jail itself."""
+
+
+class _CpuLimitExceeded(BaseException):
+    # BaseException so that a script's `except Exception` doesn't swallow it
+    pass
+
+
+def _on_cpu_limit(signum, frame):
+    raise _CpuLimitExceeded()
+
+
+def _libc_call(libc, name: str, *args):
+    if getattr(libc, name)(*args) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"{name}: {os.strerror(errno)}")
+
+
+def _jail(user: str, root: str):
+    try:
+        account = pwd.getpwnam(user)
+    except KeyError:
+        raise SandboxError(f"unknown sandbox user {user!r}") from None
+    if account.pw_uid == 0:
+        raise SandboxError("the sandbox user must not be root")
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        _libc_call(libc, "unshare", CLONE_NEWNET)
+        os.chroot(root)
+        os.chdir("/")
+        os.setgroups([])
+        os.setgid(account.pw_gid)
+        os.setuid(account.pw_uid)
+        _libc_call(libc, "prctl", PR_SET_NO_NEW_PRIVS, 1, 0, 0, 0)
+        # Other script processes run as the same user; this keeps them from tracing this one
+        _libc_call(libc, "prctl", PR_SET_DUMPABLE, 0, 0, 0, 0)
+    except OSError as e:
+        raise SandboxError(str(e)) from None
+
+
+def _limit(cpu_limit: int, memory_limit_mb: int):
+    if cpu_limit > 0:
+        # SIGXCPU at the soft limit, SIGKILL a second later should the script survive it
+        signal.signal(signal.SIGXCPU, _on_cpu_limit)
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit + 1))
+    if memory_limit_mb > 0:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    # Python ignores SIGXFSZ, so writes to files fail with an OSError
+    resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+    resource.setrlimit(resource.RLIMIT_NPROC, (0, 0))
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+
+def _builtins(allowed_modules):
+    def guarded_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or (name.split(".")[0] not in allowed_modules and name not in PRELOADED_MODULES):
+            raise ImportError(f"import of '{name}' is not allowed in reference scripts")
+        return __import__(name, globals, locals, fromlist, level)
+
+    safe = {k: v for k, v in vars(builtins).items() if k not in BLOCKED_BUILTINS}
+    safe["__import__"] = guarded_import
+    return safe
+
+
+def _compile(code: str):
+    """Wrap the script in a function, so that a top-level `return` gives its value.
+
+    Without one, a trailing expression is the value, and failing that a variable
+    named `result`.
+    """
+    body = ast.parse(code, filename=SCRIPT_FILENAME).body
+    if body and isinstance(body[-1], ast.Expr):
+        body[-1] = ast.Return(value=body[-1].value)
+    body += ast.parse("try:\n    return result\nexcept NameError:\n    return None").body
+    module = ast.parse("def __script__():\n    pass")
+    module.body[0].body = body
+    return compile(ast.fix_missing_locations(module), SCRIPT_FILENAME, "exec")
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} values can't be stored in reference data")
+
+
+def _script_line(exc: BaseException) -> str:
+    lines = [frame.lineno for frame in traceback.extract_tb(exc.__traceback__) if frame.filename == SCRIPT_FILENAME]
+    return f" (line {lines[-1]})" if lines else ""
+
+
+def run_script(code: str, allowed_modules, cpu_limit: int, max_rows: int) -> str:
+    """Run one script and return its rows as a JSON array of objects."""
+    try:
+        namespace = {"__builtins__": _builtins(allowed_modules), "__name__": "__script__"}
+        exec(_compile(code), namespace)
+        rows = namespace["__script__"]()
+        if not isinstance(rows, (list, tuple)) or not all(isinstance(row, dict) for row in rows):
+            raise ScriptError("The script must return a list of objects, e.g. [{'code': '01', 'name': '...'}]")
+        if len(rows) > max_rows:
+            raise ScriptError(f"The script returned {len(rows)} rows, more than the limit of {max_rows}")
+        return json.dumps(rows, default=_json_default, ensure_ascii=False)
+    except ScriptError:
+        raise
+    except _CpuLimitExceeded:
+        raise ScriptError(f"The script used more than {cpu_limit} s of CPU time") from None
+    except MemoryError:
+        raise ScriptError("The script ran out of memory") from None
+    except SyntaxError as e:
+        raise ScriptError(f"SyntaxError: {e.msg} (line {e.lineno})") from None
+    except Exception as e:
+        raise ScriptError(f"{type(e).__name__}: {e}{_script_line(e)}") from None
+
+
+def main():
+    settings = json.loads(sys.argv[1])
+    # The result goes to the original stdout; whatever the script prints goes nowhere
+    out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+    allowed_modules = frozenset(settings["allowed_modules"])
+    for name in (*allowed_modules, *PRELOADED_MODULES):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    try:
+        if settings["sandbox"]:
+            _jail(settings["user"], settings["root"])
+        code = sys.stdin.read()
+        _limit(settings["cpu_limit"], settings["memory_limit_mb"])
+        rows = run_script(code, allowed_modules, settings["cpu_limit"], settings["max_rows"])
+        out.write('{"rows": ' + rows + '}')
+    except SandboxError as e:
+        out.write(json.dumps({"unavailable": str(e)}))
+    except ScriptError as e:
+        out.write(json.dumps({"error": str(e)}, ensure_ascii=False))
+    out.flush()
+
+
+if __name__ == "__main__":
+    main()
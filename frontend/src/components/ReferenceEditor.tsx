@@ -18,6 +18,7 @@ import IconButton from '@mui/material/IconButton';
 import Editor, { OnMount } from '@monaco-editor/react';
 import type { editor } from 'monaco-editor';
 import { useReferenceStore, ReferenceData } from '../store/referenceStore';
+import { API_URL } from '../config';
 import './ReferenceEditor.css';
 
 export const ReferenceEditor: React.FC = () => {
@@ -119,46 +120,38 @@ export const ReferenceEditor: React.FC = () => {
     updateReference(selectedReference.id, { data_by_script: e.target.checked });
   };
 
-  const handlePreviewData = () => {
+  const handlePreviewData = async () => {
+    const fields = selectedReference.fields || [];
+    // Data can be stored by field.id or field.code, check both
+    const toDisplayRows = (rows: ReferenceData[]) => rows.map(row => {
+      const displayRow: Record<string, any> = {};
+      fields.forEach(field => {
+        const value = row.data[field.id] ?? row.data[field.code] ?? '';
+        displayRow[field.name || field.code] = value;
+      });
+      return displayRow;
+    });
+
     if (selectedReference.data_by_script) {
-      // Parse the script and simulate returning data
-      // The script should return a JSON array like [{code_f1: ..., code_f2: ...}, ...]
-      const code = selectedReference.calculation_code || '';
+      // Run the current (possibly unsaved) script on the server
       try {
-        // For now, try to extract JSON from the script by looking for return statement or last expression
-        // In a real implementation, this would execute Python on the server
-        // For preview, we'll try to parse any JSON-like structure in the code
-        const jsonMatch = code.match(/\[\s*\{[\s\S]*?\}\s*\]/);
-        if (jsonMatch) {
-          const data = JSON.parse(jsonMatch[0]);
-          setPreviewData(data);
+        const response = await fetch(`${API_URL}/api/references/${selectedReference.id}/script-data/preview`, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ calculation_code: selectedReference.calculation_code || '' }),
+        });
+        const body = await response.json();
+        if (response.ok) {
+          setPreviewData(fields.length > 0 ? toDisplayRows(body) : body.map((row: ReferenceData) => row.data));
         } else {
-          // Try to find a return statement with a list
-          setPreviewData([{ message: 'No valid JSON array found in script. Script should return [{...}, ...]' }]);
+          setPreviewData([{ error: body.detail || `Request failed with status ${response.status}` }]);
         }
       } catch (e) {
-        setPreviewData([{ error: 'Failed to parse script output', details: String(e) }]);
+        setPreviewData([{ error: 'Failed to run script', details: String(e) }]);
       }
     } else {
       // Show data from dataRows with field names as headers
-      const fields = selectedReference.fields || [];
-      const rows = selectedReference.dataRows || [];
-
-      if (rows.length === 0) {
-        setPreviewData([]);
-      } else {
-        // Transform dataRows to display format with field names
-        const displayData = rows.map(row => {
-          const displayRow: Record<string, any> = {};
-          fields.forEach(field => {
-            // Data can be stored by field.id or field.code, check both
-            const value = row.data[field.id] ?? row.data[field.code] ?? '';
-            displayRow[field.name || field.code] = value;
-          });
-          return displayRow;
-        });
-        setPreviewData(displayData);
-      }
+      setPreviewData(toDisplayRows(selectedReference.dataRows || []));
     }
     setPreviewOpen(true);
   };
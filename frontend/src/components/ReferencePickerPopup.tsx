@@ -38,23 +38,20 @@ export const ReferencePickerPopup: React.FC<ReferencePickerPopupProps> = ({
     try {
       setLoading(true);
 
-      // Load reference info
-      const refResponse = await fetch(`${API_URL}/api/references`);
+      // Load reference info together with its fields
+      const refResponse = await fetch(`${API_URL}/api/references/${referenceId}?include=fields`);
+      let dataByScript = false;
       if (refResponse.ok) {
-        const refs = await refResponse.json();
-        const ref = refs.find((r: Reference) => r.id === referenceId);
-        setReference(ref || null);
-      }
-
-      // Load fields
-      const fieldsResponse = await fetch(`${API_URL}/api/references/${referenceId}/fields`);
-      if (fieldsResponse.ok) {
-        const fieldsData = await fieldsResponse.json();
-        setFields(fieldsData);
+        const { fields: fieldsData, ...ref } = await refResponse.json();
+        setReference(ref);
+        setFields(fieldsData || []);
+        dataByScript = Boolean(ref.data_by_script);
+      } else {
+        setReference(null);
       }
 
-      // Load data with optional filter
-      let dataUrl = `${API_URL}/api/references/${referenceId}/data`;
+      // Load data with optional filter; script-backed references serve their script's cached output
+      let dataUrl = `${API_URL}/api/references/${referenceId}/${dataByScript ? 'script-data' : 'data'}`;
       if (filterField && filterValue) {
         dataUrl += `?filter_field=${encodeURIComponent(filterField)}&filter_value=${encodeURIComponent(filterValue)}`;
       }
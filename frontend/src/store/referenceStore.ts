@@ -533,89 +533,23 @@ export const useReferenceStore = create<ReferenceState>((set, get) => ({
     const state = get();
 
     try {
-      // Create new references
-      for (const [tempId, change] of state.referencesToCreate.entries()) {
-        const response = await fetch(`${API_URL}/api/references`, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(change),
-        });
-        if (!response.ok) throw new Error('Failed to create reference');
-      }
-
-      // Update existing references
-      for (const [id, change] of state.referencesToUpdate.entries()) {
-        const response = await fetch(`${API_URL}/api/references/${id}`, {
-          method: 'PUT',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(change),
-        });
-        if (!response.ok) throw new Error('Failed to update reference');
-      }
-
-      // Delete references
-      for (const id of state.referencesToDelete) {
-        const response = await fetch(`${API_URL}/api/references/${id}`, {
-          method: 'DELETE',
-        });
-        if (!response.ok) throw new Error('Failed to delete reference');
-      }
-
-      // Create new fields
-      for (const [tempId, change] of state.fieldsToCreate.entries()) {
-        const response = await fetch(`${API_URL}/api/references/${change.reference_id}/fields`, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(change),
-        });
-        if (!response.ok) throw new Error('Failed to create field');
-      }
-
-      // Update existing fields
-      for (const [id, change] of state.fieldsToUpdate.entries()) {
-        const response = await fetch(`${API_URL}/api/references/${change.reference_id}/fields/${id}`, {
-          method: 'PUT',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(change),
-        });
-        if (!response.ok) throw new Error('Failed to update field');
-      }
-
-      // Delete fields
-      for (const [fieldId, referenceId] of state.fieldsToDelete) {
-        const response = await fetch(`${API_URL}/api/references/${referenceId}/fields/${fieldId}`, {
-          method: 'DELETE',
-        });
-        if (!response.ok) throw new Error('Failed to delete field');
-      }
-
-      // Create new data rows
-      for (const [tempId, change] of state.dataToCreate.entries()) {
-        const response = await fetch(`${API_URL}/api/references/${change.reference_id}/data`, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(change),
-        });
-        if (!response.ok) throw new Error('Failed to create data row');
-      }
-
-      // Update existing data rows
-      for (const [id, change] of state.dataToUpdate.entries()) {
-        const response = await fetch(`${API_URL}/api/references/${change.reference_id}/data/${id}`, {
-          method: 'PUT',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(change),
-        });
-        if (!response.ok) throw new Error('Failed to update data row');
-      }
-
-      // Delete data rows
-      for (const [dataId, referenceId] of state.dataToDelete) {
-        const response = await fetch(`${API_URL}/api/references/${referenceId}/data/${dataId}`, {
-          method: 'DELETE',
-        });
-        if (!response.ok) throw new Error('Failed to delete data row');
-      }
+      // Send all reference, field and data changes in one transactional request
+      const response = await fetch(`${API_URL}/api/references/bulk`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          references_to_create: Array.from(state.referencesToCreate.values()),
+          references_to_update: Array.from(state.referencesToUpdate.entries()).map(([id, change]) => ({ ...change, id })),
+          references_to_delete: Array.from(state.referencesToDelete),
+          fields_to_create: Array.from(state.fieldsToCreate.values()),
+          fields_to_update: Array.from(state.fieldsToUpdate.entries()).map(([id, change]) => ({ ...change, id })),
+          fields_to_delete: Array.from(state.fieldsToDelete.keys()),
+          data_to_create: Array.from(state.dataToCreate.values()),
+          data_to_update: Array.from(state.dataToUpdate.entries()).map(([id, change]) => ({ ...change, id })),
+          data_to_delete: Array.from(state.dataToDelete.keys()),
+        }),
+      });
+      if (!response.ok) throw new Error('Failed to save reference changes');
 
       // Reload from server to get fresh data
       const currentSelectedId = get().selectedReferenceId;
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Sync vs async database mode load test for subject-area-editor
+
+Seeds a scratch database with one large reference, then starts the API under
+uvicorn twice (DATABASE_ASYNC=0 and DATABASE_ASYNC=1) and drives each with the
+same mixed read load from N concurrent clients:
+
+  - big:   full listing of the large reference (/api/references/{id}/data)
+  - cheap: a row count and a domain concept listing
+
+Reports requests/s and latency percentiles per request kind, which shows
+whether big listings starve the cheap requests.
+
+    python bench_async.py [--clients 200] [--seconds 10] [--rows 20000] [--big-ratio 0.1]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+import httpx
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+
+
+def seed(rows):
+    sys.path.insert(0, BACKEND_DIR)
+    import main
+
+    main.run_migrations()
+    ref_id = str(uuid.uuid4())
+    area_id = str(uuid.uuid4())
+    db = main.SessionLocal()
+    try:
+        db.add(main.ReferenceModel(id=ref_id, code='bench', name='bench'))
+        db.add(main.SubjectAreaModel(id=area_id, code='bench', name='bench'))
+        db.add_all(main.DomainConceptModel(
+            id=str(uuid.uuid4()), code=f'c{i}', name=f'Concept {i}', subject_area_id=area_id, sort_order=i,
+        ) for i in range(50))
+        db.flush()
+        for start in range(0, rows, 5000):
+            db.execute(main.insert(main.ReferenceDataModel.__table__), [
+                {'id': str(uuid.uuid4()), 'reference_id': ref_id,
+                 'data_json': json.dumps({'code': f'{i:06d}', 'name': f'Row number {i}'})}
+                for i in range(start, min(start + 5000, rows))
+            ])
+        db.commit()
+    finally:
+        db.close()
+    return {'ref_id': ref_id, 'area_id': area_id}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+async def wait_ready(client, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get('/health')).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError('server did not start')
+
+
+async def drive(base_url, ids, clients, seconds, big_ratio):
+    latencies = {'big': [], 'cheap': []}
+    errors = 0
+    big_path = f"/api/references/{ids['ref_id']}/data"
+    cheap_paths = [
+        f"/api/references/{ids['ref_id']}/data/count",
+        f"/api/domain-concepts?subject_area_id={ids['area_id']}",
+    ]
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        await wait_ready(client)
+
+        async def worker(stop_at):
+            nonlocal errors
+            rng = random.Random()
+            while time.monotonic() < stop_at:
+                kind = 'big' if rng.random() < big_ratio else 'cheap'
+                path = big_path if kind == 'big' else rng.choice(cheap_paths)
+                started = time.perf_counter()
+                try:
+                    r = await client.get(path)
+                    r.raise_for_status()
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies[kind].append(time.perf_counter() - started)
+
+        stop_at = time.monotonic() + seconds
+        await asyncio.gather(*(worker(stop_at) for _ in range(clients)))
+    return latencies, errors
+
+
+def percentile(values, q):
+    if not values:
+        return float('nan')
+    return statistics.quantiles(values, n=100, method='inclusive')[q - 1] if len(values) > 1 else values[0]
+
+
+def run_mode(name, db_path, ids, args):
+    port = free_port()
+    env = dict(os.environ, DATABASE_PATH=db_path, DATABASE_ASYNC='1' if name == 'async' else '0',
+               MIGRATE_ON_STARTUP='0')
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--port', str(port), '--log-level', 'warning'],
+        cwd=BACKEND_DIR, env=env,
+    )
+    try:
+        latencies, errors = asyncio.run(
+            drive(f'http://127.0.0.1:{port}', ids, args.clients, args.seconds, args.big_ratio)
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    result = {'errors': errors}
+    for kind, values in latencies.items():
+        result[f'{kind} req/s'] = len(values) / args.seconds
+        for q in (50, 95, 99):
+            result[f'{kind} p{q} ms'] = percentile(values, q) * 1000
+    return name, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--big-ratio', type=float, default=0.1, help='share of requests that are big listings')
+    parser.add_argument('--seed', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.seed:
+        print(json.dumps(seed(args.rows)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        out = subprocess.run(
+            [sys.executable, __file__, '--seed', '--rows', str(args.rows)],
+            env=dict(os.environ, DATABASE_PATH=db_path), cwd=BACKEND_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout
+        ids = json.loads(out.strip().splitlines()[-1])
+        results = [run_mode(name, db_path, ids, args) for name in ('sync', 'async')]
+
+    print(f'{args.clients} clients, {args.seconds:g}s per mode, {args.rows} rows, big ratio {args.big_ratio:g}')
+    print(f"{'':20}" + ''.join(f'{name:>12}' for name, _ in results))
+    for metric in results[0][1]:
+        print(f'{metric:20}' + ''.join(f'{r[metric]:12.1f}' for _, r in results))
+
+
+if __name__ == '__main__':
+    main()
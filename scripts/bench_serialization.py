@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+List endpoint serialization benchmark for subject-area-editor
+
+Seeds a scratch database with one reference holding --rows data rows and a
+subject area with --concepts domain concepts, then requests the list
+endpoints in-process with the default Pydantic responses and with
+FAST_JSON_RESPONSES. Checks that both modes return identical JSON and
+reports the median time per request.
+
+    python bench_serialization.py [--rows 20000] [--concepts 2000] [--repeat 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+
+
+def seed(main, rows, concepts):
+    ref_id = str(uuid.uuid4())
+    area_id = str(uuid.uuid4())
+    field_ids = [str(uuid.uuid4()) for _ in range(5)]
+    db = main.SessionLocal()
+    try:
+        db.add(main.ReferenceModel(id=ref_id, code='bench', name='bench'))
+        db.add_all(main.ReferenceFieldModel(id=field_id, reference_id=ref_id, code=f'f{i}', name=f'Field {i}')
+                   for i, field_id in enumerate(field_ids))
+        db.add(main.SubjectAreaModel(id=area_id, code='bench', name='bench'))
+        db.flush()
+        db.execute(main.insert(main.DomainConceptModel.__table__), [
+            {'id': str(uuid.uuid4()), 'code': f'c{i}', 'name': f'Concept {i}', 'subject_area_id': area_id,
+             'concept_type': 'attribute', 'data_type': 'string', 'sort_order': i,
+             'created_at': main.datetime.utcnow(), 'updated_at': main.datetime.utcnow()}
+            for i in range(concepts)
+        ])
+        for start in range(0, rows, 5000):
+            db.execute(main.insert(main.ReferenceDataModel.__table__), [
+                {'id': str(uuid.uuid4()), 'reference_id': ref_id,
+                 'data_json': json.dumps({field_ids[0]: f'{i:06d}', field_ids[1]: f'Строка {i}', field_ids[2]: i}),
+                 'created_at': main.datetime.utcnow(), 'updated_at': main.datetime.utcnow()}
+                for i in range(start, min(start + 5000, rows))
+            ])
+        db.commit()
+    finally:
+        db.close()
+    return ref_id, area_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--concepts', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ['DATABASE_PATH'] = os.path.join(tmp, 'bench.db')
+    sys.path.insert(0, BACKEND_DIR)
+    import main as app_main
+    from fastapi.testclient import TestClient
+
+    app_main.run_migrations()
+    ref_id, area_id = seed(app_main, args.rows, args.concepts)
+    client = TestClient(app_main.app)
+    endpoints = {
+        'reference data': f'/api/references/{ref_id}/data',
+        'reference data page': f'/api/references/{ref_id}/data?limit=1000',
+        'domain concepts': f'/api/domain-concepts?subject_area_id={area_id}',
+        'references': '/api/references',
+        'subject areas': '/api/subject-areas',
+    }
+
+    print(f'{args.rows} data rows, {args.concepts} concepts, median of {args.repeat}')
+    print(f"{'':22}{'pydantic ms':>14}{'fast ms':>10}{'speedup':>10}")
+    for name, path in endpoints.items():
+        timings, bodies = {}, {}
+        for fast in (False, True):
+            app_main.FAST_JSON_RESPONSES = fast
+            samples = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                r = client.get(path)
+                samples.append(time.perf_counter() - started)
+                r.raise_for_status()
+            timings[fast] = statistics.median(samples) * 1000
+            bodies[fast] = r.json()
+        if bodies[False] != bodies[True]:
+            sys.exit(f'{name}: responses differ between modes')
+        print(f'{name:22}{timings[False]:14.1f}{timings[True]:10.1f}{timings[False] / timings[True]:9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
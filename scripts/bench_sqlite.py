@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+SQLite pragma profile benchmark for subject-area-editor
+
+Runs the same workload against a scratch database twice: once with SQLite
+defaults (rollback journal, synchronous=FULL) and once with the tuned
+profile from backend/main.py. Each run measures
+
+  - writes: single-row insert + commit, as the per-row API endpoints do
+  - reads: reference data listing, alone and while a writer is committing
+
+    python bench_sqlite.py [--rows 2000] [--readers 4] [--seconds 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+
+DEFAULT_PROFILE = {
+    'SQLITE_JOURNAL_MODE': 'DELETE',
+    'SQLITE_SYNCHRONOUS': 'FULL',
+    'SQLITE_MMAP_SIZE': '0',
+    'SQLITE_CACHE_SIZE': '-2000',
+    'SQLITE_TEMP_STORE': 'DEFAULT',
+    'SQLITE_BUSY_TIMEOUT': '5000',
+}
+
+
+def run_workload(rows, readers, seconds):
+    sys.path.insert(0, BACKEND_DIR)
+    import main
+
+    main.run_migrations()
+    ref_id = str(uuid.uuid4())
+    db = main.SessionLocal()
+    try:
+        db.add(main.ReferenceModel(id=ref_id, code='bench', name='bench'))
+        db.commit()
+    finally:
+        db.close()
+
+    started = time.perf_counter()
+    for i in range(rows):
+        db = main.SessionLocal()
+        try:
+            db.add(main.ReferenceDataModel(reference_id=ref_id, data_json=json.dumps({'n': i})))
+            db.commit()
+        finally:
+            db.close()
+    write_rate = rows / (time.perf_counter() - started)
+
+    def read_loop(stop, counter):
+        while not stop.is_set():
+            db = main.SessionLocal()
+            try:
+                db.query(main.ReferenceDataModel).filter(main.ReferenceDataModel.reference_id == ref_id).all()
+            finally:
+                db.close()
+            counter.append(1)
+
+    def write_loop(stop, counter):
+        while not stop.is_set():
+            db = main.SessionLocal()
+            try:
+                db.add(main.ReferenceDataModel(reference_id=ref_id, data_json='{}'))
+                db.commit()
+            finally:
+                db.close()
+            counter.append(1)
+
+    def measure(with_writer):
+        stop = threading.Event()
+        reads, writes = [], []
+        threads = [threading.Thread(target=read_loop, args=(stop, reads)) for _ in range(readers)]
+        if with_writer:
+            threads.append(threading.Thread(target=write_loop, args=(stop, writes)))
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        return len(reads) / seconds, len(writes) / seconds
+
+    read_rate, _ = measure(with_writer=False)
+    mixed_read_rate, mixed_write_rate = measure(with_writer=True)
+    return {
+        'writes/s': write_rate,
+        'reads/s': read_rate,
+        'reads/s (with writer)': mixed_read_rate,
+        'writes/s (with readers)': mixed_write_rate,
+    }
+
+
+def run_profile(name, env_overrides, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_PATH=os.path.join(tmp, 'bench.db'), **env_overrides)
+        out = subprocess.run(
+            [sys.executable, __file__, '--worker',
+             '--rows', str(args.rows), '--readers', str(args.readers), '--seconds', str(args.seconds)],
+            env=env, cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout
+    return name, json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=3)
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_workload(args.rows, args.readers, args.seconds)))
+        return
+
+    results = [
+        run_profile('defaults', DEFAULT_PROFILE, args),
+        run_profile('tuned', {}, args),
+    ]
+    metrics = list(results[0][1])
+    print(f"{'':26}" + ''.join(f'{name:>12}' for name, _ in results))
+    for metric in metrics:
+        print(f'{metric:26}' + ''.join(f'{r[metric]:12.1f}' for _, r in results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Database backup / restore for subject-area-editor
+
+Streams the whole database through the API as NDJSON, one
+{"table": ..., "row": {...}} object per line.
+
+    python db_backup.py export backup.ndjson
+    python db_backup.py import backup.ndjson [--replace]
+"""
+import argparse
+import os
+import sys
+
+import requests
+
+API_URL = os.environ.get("API_URL", "http://localhost:8001")
+CHUNK_SIZE = 1024 * 1024
+
+
+def export_db(path, tables=None):
+    params = {"tables": tables} if tables else None
+    with requests.get(f"{API_URL}/api/export", params=params, stream=True) as r:
+        r.raise_for_status()
+        with open(path, "wb") as f:
+            for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                f.write(chunk)
+    print(f"Exported to {path}")
+
+
+def import_db(path, replace=False):
+    with open(path, "rb") as f:
+        # Passing the file object makes requests stream the body instead of loading it
+        r = requests.post(
+            f"{API_URL}/api/import",
+            params={"replace": "true"} if replace else None,
+            data=f,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    if not r.ok:
+        print(f"Import failed: {r.status_code} {r.text}", file=sys.stderr)
+        sys.exit(1)
+    for table, count in r.json()["imported"].items():
+        print(f"  {table}: {count}")
+    print("Done!")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_export = sub.add_parser("export", help="dump the database to an NDJSON file")
+    p_export.add_argument("path")
+    p_export.add_argument("--tables", help="comma-separated table names (default: all)")
+
+    p_import = sub.add_parser("import", help="load an NDJSON dump into the database")
+    p_import.add_argument("path")
+    p_import.add_argument("--replace", action="store_true", help="empty all tables before importing")
+
+    args = parser.parse_args()
+    if args.command == "export":
+        export_db(args.path, args.tables)
+    else:
+        import_db(args.path, args.replace)
+
+
+if __name__ == "__main__":
+    main()